@@ -1,28 +1,418 @@
+import asyncio
 import gradio as gr
+import httpx
+import uvicorn
+from fastapi import FastAPI
+import numpy as np
 import ollama
 import os
-from typing import Tuple, Optional
+from typing import AsyncIterator, Iterator, Tuple, Optional
 import re
-import PyPDF2
+import pypdfium2 as pdfium
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 import io
 import tempfile
+import functools
+from html import escape
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import sqlite3
+import threading
+import time
+
+# Precompiled patterns for LaTeX conversion and LLM output cleanup.
+# All LaTeX rules share one alternation so the text is scanned once; the
+# specific commands come first so they win over the generic catch-alls.
+# The single pass only matches the sequential rules below when no rule's
+# output can feed another, so _RE_LATEX_OVERLAP sends those texts down the
+# sequential path: a backslash inside braces (nested commands) or directly
+# after a command or another backslash (the removal would merge the two).
+_RE_LATEX_ALL = re.compile(
+    r'(?P<section>\\section\{([^}]+)\})'
+    r'|(?P<cventry>\\cventry\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]*)\})'
+    r'|(?P<cvitem>\\cvitem\{([^}]+)\}\{([^}]+)\})'
+    r'|(?P<arg>\\[a-zA-Z]+\{[^}]*\})'
+    r'|(?P<cmd>\\[a-zA-Z]+)'
+)
+_RE_LATEX_OVERLAP = re.compile(r'\{[^}]*\\|\\[a-zA-Z]*\\')
+_RE_SECTION = re.compile(r'\\section\{([^}]+)\}')
+_RE_CVENTRY = re.compile(r'\\cventry\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]*)\}')
+_RE_CVITEM = re.compile(r'\\cvitem\{([^}]+)\}\{([^}]+)\}')
+_RE_LATEX_CMD_ARG = re.compile(r'\\[a-zA-Z]+\{[^}]*\}')
+_RE_LATEX_CMD = re.compile(r'\\[a-zA-Z]+')
+_RE_THINK = re.compile(r'<think>.*?</think>', re.DOTALL)
+_RE_XML = re.compile(r'<[^>]+>')
+_RE_NAME = re.compile(r'NAME:', re.IGNORECASE)
+_RE_MULTINL = re.compile(r'\n\s*\n\s*\n')
+_RE_CAPITALIZED = re.compile(r'\b[A-Z][a-z]+\b')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_RE_BETWEEN_TAGS = re.compile(r'>\s+<')
+_RE_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_RE_CSS_PUNCTUATION = re.compile(r'\s*([{}:;,])\s*')
+
+# Simple keyword extraction (in production, use more sophisticated NLP)
+COMMON_SKILLS = [
+    'python', 'javascript', 'react', 'node.js', 'sql', 'aws', 'docker',
+    'kubernetes', 'machine learning', 'data analysis', 'project management',
+    'agile', 'scrum', 'communication', 'leadership', 'teamwork'
+]
+# Zero-width lookahead so overlapping skills are all found in a single scan,
+# matching the substring semantics of `skill in text`
+_RE_SKILLS = re.compile('(?=(' + '|'.join(map(re.escape, COMMON_SKILLS)) + '))')
+
+@functools.lru_cache(maxsize=128)
+def _find_keywords(text: str) -> frozenset:
+    """Keyword extraction shared by every editor, memoized on the text itself"""
+    # Find every known skill in one pass over the text
+    found_keywords = set(_RE_SKILLS.findall(text.lower()))
+    
+    # Also extract capitalized words (likely to be technologies/skills)
+    capitalized_words = _RE_CAPITALIZED.findall(text)
+    found_keywords.update(capitalized_words[:5])
+    
+    return frozenset(found_keywords)
+
+def _latex_replacement(match: re.Match) -> str:
+    """Map a _RE_LATEX_ALL match to its processable form"""
+    kind = match.lastgroup
+    if kind == 'section':
+        return f"SECTION: {match.group(2)}"
+    if kind == 'cventry':
+        parts = match.group(4, 5, 6, 7, 8, 9)
+        return f"CVENTRY: {parts[0]} | {parts[1]} | {parts[2]} | {parts[3]}\n{parts[5]}"
+    if kind == 'cvitem':
+        return f"CVITEM: {match.group(11)}: {match.group(12)}"
+    # Remove other LaTeX commands
+    return ''
+
+# Input limits and context size for generation; a fixed num_ctx avoids model reloads
+MAX_RESUME_CHARS = 8000
+MAX_JOB_DESCRIPTION_CHARS = 4000
+LLM_NUM_PREDICT = 1500
+LLM_NUM_CTX = 8192
+
+# Static instructions go in the system message so every request shares the
+# same prompt prefix and Ollama can reuse its KV cache; inputs go at the end
+_SYSTEM_PROMPT = """You must extract resume information and format it exactly as specified. Do not include any thinking, explanations, or commentary. Start your response immediately with "NAME:" and follow the exact format.
+
+FORMAT REQUIRED:
+NAME: [Full Name]
+EMAIL: [Email Address]
+PHONE: [Phone Number]
+LOCATION: [City, State/Country]
+
+SUMMARY: [2-3 line professional summary tailored to the job]
+
+EXPERIENCE:
+- [Job Title] | [Company] | [Dates] | [Location]
+  [Bullet point achievement 1 with metrics if possible]
+  [Bullet point achievement 2 with metrics if possible]
+  [Bullet point achievement 3 with metrics if possible]
+
+EDUCATION:
+- [Degree] | [Institution] | [Year] | [Location]
+
+SKILLS:
+- [Skill Category]: [Relevant skills matching job requirements]
+
+PROJECTS: (if applicable)
+- [Project Name]: [Brief description with technologies used]"""
+
+# Concurrent edits admitted by Gradio (the "llm" pool). Set
+# RESUME_EDITOR_LLM_CONCURRENCY to the Ollama server's parallel request slots
+# so admitted edits are batched together instead of queueing inside Ollama
+LLM_CONCURRENCY = int(os.getenv("RESUME_EDITOR_LLM_CONCURRENCY", "4"))
+# Local PDF previews are cheap, so they get their own wide pool and never
+# wait behind queued LLM edits
+PREVIEW_CONCURRENCY = 32
+# PDFium is not thread-safe, even across separate documents, so every
+# open/extract/close is serialized while the rest of a preview stays parallel
+_PDFIUM_LOCK = threading.Lock()
+
+# Minimum seconds between streamed UI updates (at most 20 per second)
+STREAM_UPDATE_INTERVAL = 0.05
+
+# One pooled async client per process, shared by every editor and request so
+# keep-alive connections to Ollama are reused. No read timeout: the first
+# chunk can take minutes while the model loads.
+_OLLAMA_ASYNC_CLIENT = ollama.AsyncClient(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(None, connect=10.0)
+)
+
+# How long a model listing from Ollama is reused, in seconds
+MODEL_LIST_TTL = 60
+
+@functools.lru_cache(maxsize=1)
+def _list_ollama_models(ttl_bucket: int):
+    """List installed Ollama models; ttl_bucket changes every MODEL_LIST_TTL seconds to expire the cache"""
+    return ollama.list()
+
+# Persistent cache for LLM responses
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "resume_editor", "cache.sqlite")
+CACHE_MAX_ROWS = 500
+CACHE_PRUNE_EVERY = 50
+CACHE_MEMORY_ROWS = 512
+# Seconds to wait for another process's write lock on the shared cache file
+CACHE_LOCK_TIMEOUT = 5.0
+
+# Semantic cache: for the same resume, a near-duplicate job description reuses a
+# cached response. The resume itself always matches exactly, so a hit can never
+# return another candidate's details
+EMBEDDING_MODEL = "nomic-embed-text"
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+class ResponseCache:
+    """SQLite-backed LRU cache of LLM responses keyed on a hash of the inputs,
+    fronted by an in-process LRU so repeat hits skip the database"""
+    
+    def __init__(self, path: str = CACHE_PATH, max_rows: int = CACHE_MAX_ROWS,
+                 memory_rows: int = CACHE_MEMORY_ROWS):
+        self.max_rows = max_rows
+        self.memory_rows = memory_rows
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._memory = OrderedDict()
+        # The cache is only an optimisation: a corrupt, read-only or unreachable
+        # file falls back to an in-memory database instead of failing startup
+        conn = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            conn = sqlite3.connect(path, timeout=CACHE_LOCK_TIMEOUT, check_same_thread=False)
+            self._create_schema(conn)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not open response cache at {path}: {e}")
+            if conn is not None:
+                conn.close()
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._create_schema(conn)
+        self._conn = conn
+        # In-memory copy of the stored vectors per scope: (keys, matrix)
+        self._vectors = {}
+    
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection):
+        """Create the cache tables, failing early if the database is unusable"""
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT, ts REAL)"
+        )
+        # Only job descriptions are embedded, and scope is the resume_key of the
+        # resume they were paired with, so a semantic hit never crosses resumes
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_embeddings "
+            "(key TEXT PRIMARY KEY, scope TEXT, vector BLOB)"
+        )
+        # Always writes the header, so a read-only file is caught here rather
+        # than on the first cache write
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the given strings into a cache key"""
+        return hashlib.blake2b("\x00".join(parts).encode(), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            # Refresh the timestamp so recently used entries survive pruning
+            self._conn.execute("UPDATE responses SET ts = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self._remember(key, row[0])
+        return row[0]
+    
+    def _remember(self, key: str, response: str):
+        """Add a response to the in-process LRU, evicting the least recently used"""
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_rows:
+            self._memory.popitem(last=False)
+    
+    def get_similar(self, scope: str, vector: np.ndarray,
+                    threshold: float = SEMANTIC_CACHE_THRESHOLD) -> Optional[str]:
+        """Return the response in scope whose unit-length embedding is closest to vector, if above threshold"""
+        with self._lock:
+            if scope not in self._vectors:
+                rows = self._conn.execute(
+                    "SELECT key, vector FROM job_embeddings WHERE scope = ?", (scope,)
+                ).fetchall()
+                keys = [row[0] for row in rows]
+                matrix = np.array([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+                self._vectors[scope] = (keys, matrix)
+            keys, matrix = self._vectors[scope]
+            if not keys or matrix.shape[1] != vector.shape[0]:
+                return None
+            
+            # Vectors are normalized, so the dot product is the cosine similarity
+            scores = matrix @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < threshold:
+                return None
+            key = keys[best]
+        return self.get(key)
+    
+    def set(self, key: str, response: str, scope: Optional[str] = None,
+            vector: Optional[np.ndarray] = None):
+        """Store a response (and its embedding) and periodically prune the oldest entries"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+            self._remember(key, response)
+            if scope is not None and vector is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO job_embeddings (key, scope, vector) VALUES (?, ?, ?)",
+                    (key, scope, vector.astype(np.float32).tobytes())
+                )
+                self._vectors.pop(scope, None)
+            self._writes += 1
+            if self._writes % CACHE_PRUNE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY ts DESC LIMIT ?)",
+                    (self.max_rows,)
+                )
+                self._conn.execute(
+                    "DELETE FROM job_embeddings WHERE key NOT IN (SELECT key FROM responses)"
+                )
+                self._vectors.clear()
+            self._conn.commit()
+
+class _StreamBuffer:
+    """Accumulates streamed LLM chunks and throttles partial UI updates"""
+    
+    def __init__(self, interval: float = STREAM_UPDATE_INTERVAL):
+        self._parts = []
+        self._interval = interval
+        self._last_update = 0.0
+    
+    def add(self, chunk: str) -> Optional[str]:
+        """Append a chunk and return the displayable text so far when an update
+        is due. Chunks are coalesced so the textbox is not re-rendered per
+        token; the caller's final yield always carries the complete text."""
+        self._parts.append(chunk)
+        now = time.monotonic()
+        if now - self._last_update < self._interval:
+            return None
+        self._last_update = now
+        return self._visible("".join(self._parts))
+    
+    def text(self) -> str:
+        """Return everything received so far"""
+        return "".join(self._parts)
+    
+    @staticmethod
+    def _visible(text: str) -> Optional[str]:
+        """Hide the model's reasoning from partial updates: nothing is shown
+        until the <think> block closes, then only the text from NAME: on"""
+        start = text.find('<think>')
+        if start != -1:
+            end = text.find('</think>', start)
+            if end == -1:
+                return None
+            text = text[end + len('</think>'):]
+        name_match = _RE_NAME.search(text)
+        if name_match is None:
+            return None
+        return text[name_match.start():]
+
+class _ChatRecorder:
+    """Records the content and stop reason of a streamed ollama.chat response"""
+    
+    def __init__(self):
+        self._parts = []
+        self.done_reason = None
+    
+    def record(self, chunk) -> str:
+        """Keep a chunk's content and stop reason and return the content"""
+        content = chunk['message']['content']
+        self._parts.append(content)
+        self.done_reason = chunk.get('done_reason') or self.done_reason
+        return content
+    
+    def text(self) -> str:
+        """Return the full response received so far"""
+        return "".join(self._parts)
 
 class ResumeEditor:
     def __init__(self):
         # Initialize Ollama client for DeepSeek R1
-        self.model_name = "deepseek-r1:latest"
+        self.model_name = "deepseek-r1:7b-qwen-distill-q4_K_M"
+        self._async_client = _OLLAMA_ASYNC_CLIENT
+        self._cache = ResponseCache()
+        self._embeddings_available = True
+        self._pdf_cache = {}
+        # Runs the keyword analysis alongside LLM generation and PDF rendering
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        
+        # PDF styles for LaTeX-like formatting, built once and shared across PDFs
+        self._styles = getSampleStyleSheet()
+        
+        # Section header style (for \section{})
+        self._section_style = ParagraphStyle(
+            'SectionHeader',
+            parent=self._styles['Heading1'],
+            fontSize=14,
+            spaceAfter=12,
+            spaceBefore=20,
+            textColor='#2E4057',
+            fontName='Helvetica-Bold'
+        )
+        
+        # Subsection style (for \cventry{})
+        self._subsection_style = ParagraphStyle(
+            'SubsectionHeader',
+            parent=self._styles['Heading2'],
+            fontSize=12,
+            spaceAfter=8,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        )
+        
+        # Normal text style
+        self._normal_style = ParagraphStyle(
+            'CustomNormal',
+            parent=self._styles['Normal'],
+            fontSize=10,
+            spaceAfter=6,
+            leading=12
+        )
+        
+        # Item style (for \cvitem{})
+        self._item_style = ParagraphStyle(
+            'ItemStyle',
+            parent=self._styles['Normal'],
+            fontSize=10,
+            spaceAfter=4,
+            leftIndent=20,
+            leading=12
+        )
+        
         self.check_ollama_model()
     
     def check_ollama_model(self):
         """Check if DeepSeek R1 model is available in Ollama"""
         try:
-            models = ollama.list()
+            models = _list_ollama_models(int(time.time() // MODEL_LIST_TTL))
             if 'models' in models:
-                model_names = [model.get('name', '') for model in models['models']]
+                model_names = {model.get('name', '') for model in models['models']}
                 if self.model_name not in model_names:
                     print(f"Warning: {self.model_name} not found. Available models: {model_names}")
                     print(f"To install DeepSeek R1, run: ollama pull {self.model_name}")
@@ -34,126 +424,139 @@ class ResumeEditor:
             print(f"Warning: Could not connect to Ollama: {e}")
             print("Make sure Ollama is running. Start it with: ollama serve")
     
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text with the local embedding model, normalized to unit length"""
+        if not self._embeddings_available:
+            return None
+        try:
+            response = ollama.embeddings(model=EMBEDDING_MODEL, prompt=text)
+        except Exception as e:
+            # Disable the semantic cache rather than retrying on every request
+            print(f"Warning: Semantic cache disabled, could not embed with {EMBEDDING_MODEL}: {e}")
+            print(f"To enable it, run: ollama pull {EMBEDDING_MODEL}")
+            self._embeddings_available = False
+            return None
+        
+        vector = np.asarray(response['embedding'], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None
+        return vector / norm
+    
     def extract_text_from_pdf(self, pdf_file) -> str:
         """Extract text from uploaded PDF file"""
         try:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            # Reuse the text from the preview if the file has not changed since;
+            # file objects have no stable identity, so they are always parsed
+            cache_key = None
+            if isinstance(pdf_file, (str, os.PathLike)):
+                cache_key = (os.fspath(pdf_file), os.path.getmtime(pdf_file))
+                if cache_key in self._pdf_cache:
+                    return self._pdf_cache[cache_key]
+            
+            with _PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(pdf_file)
+                try:
+                    pages = []
+                    for page in pdf:
+                        textpage = page.get_textpage()
+                        try:
+                            pages.append(textpage.get_text_range())
+                        finally:
+                            textpage.close()
+                            page.close()
+                finally:
+                    pdf.close()
+            # PDFium separates lines with \r\n; the rest of the pipeline expects \n
+            text = "\n".join(pages).replace('\r\n', '\n').strip()
+            
+            # Only the most recent upload is kept
+            if cache_key is not None:
+                self._pdf_cache = {cache_key: text}
+            return text
         except Exception as e:
             return f"Error reading PDF: {str(e)}"
     
     def create_pdf_from_text(self, text: str) -> str:
         """Create a PDF file from LaTeX-formatted text and return the file path"""
         try:
-            # Create a temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            temp_file.close()
-            
-            # Create PDF document
-            doc = SimpleDocTemplate(temp_file.name, pagesize=letter,
+            # Build the PDF in memory
+            buffer = io.BytesIO()
+            doc = SimpleDocTemplate(buffer, pagesize=letter,
                                   rightMargin=72, leftMargin=72,
                                   topMargin=72, bottomMargin=18)
             
-            # Define styles for LaTeX-like formatting
-            styles = getSampleStyleSheet()
-            
-            # Section header style (for \section{})
-            section_style = ParagraphStyle(
-                'SectionHeader',
-                parent=styles['Heading1'],
-                fontSize=14,
-                spaceAfter=12,
-                spaceBefore=20,
-                textColor='#2E4057',
-                fontName='Helvetica-Bold'
-            )
-            
-            # Subsection style (for \cventry{})
-            subsection_style = ParagraphStyle(
-                'SubsectionHeader',
-                parent=styles['Heading2'],
-                fontSize=12,
-                spaceAfter=8,
-                spaceBefore=12,
-                fontName='Helvetica-Bold'
-            )
-            
-            # Normal text style
-            normal_style = ParagraphStyle(
-                'CustomNormal',
-                parent=styles['Normal'],
-                fontSize=10,
-                spaceAfter=6,
-                leading=12
-            )
-            
-            # Item style (for \cvitem{})
-            item_style = ParagraphStyle(
-                'ItemStyle',
-                parent=styles['Normal'],
-                fontSize=10,
-                spaceAfter=4,
-                leftIndent=20,
-                leading=12
-            )
-            
             # Build PDF content
             story = []
             
             # Process LaTeX-like formatting
             text = self._process_latex_formatting(text)
             
+            # Bind hot names to locals for the per-line loop
+            append = story.append
+            section_style = self._section_style
+            subsection_style = self._subsection_style
+            item_style = self._item_style
+            normal_style = self._normal_style
+            
             # Split text into lines and process
-            lines = text.split('\n')
-            for line in lines:
+            for line in text.split('\n'):
                 line = line.strip()
                 if not line:
-                    story.append(Spacer(1, 6))
+                    append(Spacer(1, 6))
                     continue
                 
                 # Process LaTeX commands
                 if line.startswith('SECTION:'):
-                    section_title = line.replace('SECTION:', '').strip()
-                    story.append(Paragraph(section_title, section_style))
+                    section_title = line[len('SECTION:'):].strip()
+                    append(Paragraph(section_title, section_style))
                 elif line.startswith('CVENTRY:'):
-                    entry_text = line.replace('CVENTRY:', '').strip()
-                    story.append(Paragraph(entry_text, subsection_style))
+                    entry_text = line[len('CVENTRY:'):].strip()
+                    append(Paragraph(entry_text, subsection_style))
                 elif line.startswith('CVITEM:'):
-                    item_text = line.replace('CVITEM:', '').strip()
-                    story.append(Paragraph(f"• {item_text}", item_style))
+                    item_text = line[len('CVITEM:'):].strip()
+                    append(Paragraph(f"• {item_text}", item_style))
                 else:
                     # Regular text
-                    line = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                    story.append(Paragraph(line, normal_style))
+                    append(Paragraph(escape(line, quote=False), normal_style))
             
             # Build PDF
             doc.build(story)
             
-            return temp_file.name
+            # Gradio needs a file path, so write the bytes out in one go
+            fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+            try:
+                os.write(fd, buffer.getvalue())
+            finally:
+                os.close(fd)
+            
+            return pdf_path
             
         except Exception as e:
             return f"Error creating PDF: {str(e)}"
     
     def _process_latex_formatting(self, text: str) -> str:
         """Convert LaTeX commands to processable format"""
-        import re
+        # Plain-text output (the usual case) has no LaTeX commands to convert
+        if '\\' not in text:
+            return text
+        
+        # Convert \section{}, \cventry{} and \cvitem{} and drop other commands in one pass
+        if not _RE_LATEX_OVERLAP.search(text):
+            return _RE_LATEX_ALL.sub(_latex_replacement, text)
         
         # Convert \section{} to SECTION:
-        text = re.sub(r'\\section\{([^}]+)\}', r'SECTION: \1', text)
+        text = _RE_SECTION.sub(r'SECTION: \1', text)
         
         # Convert \cventry{} to CVENTRY:
-        text = re.sub(r'\\cventry\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]+)\}\{([^}]*)\}', 
-                     r'CVENTRY: \1 | \2 | \3 | \4\n\6', text)
+        text = _RE_CVENTRY.sub(r'CVENTRY: \1 | \2 | \3 | \4\n\6', text)
         
         # Convert \cvitem{} to CVITEM:
-        text = re.sub(r'\\cvitem\{([^}]+)\}\{([^}]+)\}', r'CVITEM: \1: \2', text)
+        text = _RE_CVITEM.sub(r'CVITEM: \1: \2', text)
         
         # Remove other LaTeX commands
-        text = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', '', text)
-        text = re.sub(r'\\[a-zA-Z]+', '', text)
+        text = _RE_LATEX_CMD_ARG.sub('', text)
+        text = _RE_LATEX_CMD.sub('', text)
         
         return text
     
@@ -161,31 +564,100 @@ class ResumeEditor:
         """
         Edit resume based on job description using Ollama DeepSeek R1
         """
-        # Handle PDF input if provided
-        if pdf_file is not None:
-            resume_text = self.extract_text_from_pdf(pdf_file)
-            if resume_text.startswith("Error"):
-                return resume_text, "", None
-        
-        if not resume_text.strip() or not job_description.strip():
-            return "Please provide both resume and job description.", "", None
+        result = ("", "", None)
+        for result in self.edit_resume_stream(resume_text, job_description, pdf_file):
+            pass
+        return result
+    
+    def edit_resume_stream(self, resume_text: str, job_description: str,
+                           pdf_file=None) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """
+        Streaming version of edit_resume: yields the partial LLM output as it is
+        generated, then the cleaned resume with its analysis and PDF
+        """
+        resume_text, error = self._resolve_inputs(resume_text, job_description, pdf_file)
+        if error:
+            yield error, "", None
+            return
         
         try:
-            # Use Ollama DeepSeek R1 for resume editing
-            edited_resume = self._ollama_edit_resume(resume_text, job_description)
+            # Generate analysis in the background; it only depends on the inputs
+            analysis_future = self._pool.submit(self._generate_analysis, resume_text, job_description)
+            
+            # Use Ollama DeepSeek R1 for resume editing, showing tokens as they arrive
+            buffer = _StreamBuffer()
+            try:
+                for chunk in self._ollama_edit_resume_stream(resume_text, job_description):
+                    partial = buffer.add(chunk)
+                    if partial is not None:
+                        yield partial, "", None
+                edited_resume = self._clean_llm_output(buffer.text())
+            except Exception as e:
+                edited_resume = self._ollama_error(e)
             
-            # Generate analysis
-            analysis = self._generate_analysis(resume_text, job_description)
+            yield self._finish_edit(edited_resume, analysis_future)
+            
+        except Exception as e:
+            yield f"Error: {str(e)}", "", None
+    
+    async def edit_resume_astream(self, resume_text: str, job_description: str,
+                                  pdf_file=None) -> AsyncIterator[Tuple[str, str, Optional[str]]]:
+        """
+        Async version of edit_resume_stream for the Gradio handler: the LLM call
+        runs on the event loop and blocking work is handed to threads
+        """
+        resume_text, error = await asyncio.to_thread(
+            self._resolve_inputs, resume_text, job_description, pdf_file
+        )
+        if error:
+            yield error, "", None
+            return
+        
+        try:
+            # Generate analysis in the background; it only depends on the inputs
+            analysis_future = self._pool.submit(self._generate_analysis, resume_text, job_description)
             
-            # Create PDF if requested
-            pdf_path = None
-            if edited_resume and not edited_resume.startswith("Error"):
-                pdf_path = self.create_pdf_from_text(edited_resume)
+            # Use Ollama DeepSeek R1 for resume editing, showing tokens as they arrive
+            buffer = _StreamBuffer()
+            try:
+                async for chunk in self._ollama_edit_resume_astream(resume_text, job_description):
+                    partial = buffer.add(chunk)
+                    if partial is not None:
+                        yield partial, "", None
+                edited_resume = self._clean_llm_output(buffer.text())
+            except Exception as e:
+                edited_resume = self._ollama_error(e)
             
-            return edited_resume, analysis, pdf_path
+            # Not on self._pool: _finish_edit waits on an analysis queued there
+            yield await asyncio.to_thread(self._finish_edit, edited_resume, analysis_future)
             
         except Exception as e:
-            return f"Error: {str(e)}", "", None
+            yield f"Error: {str(e)}", "", None
+    
+    def _resolve_inputs(self, resume_text: str, job_description: str,
+                        pdf_file=None) -> Tuple[str, Optional[str]]:
+        """Return the resume text to edit and an error message if the inputs are unusable"""
+        # Handle PDF input if provided
+        if pdf_file is not None:
+            resume_text = self.extract_text_from_pdf(pdf_file)
+            if resume_text.startswith("Error"):
+                return resume_text, resume_text
+        
+        if not resume_text.strip() or not job_description.strip():
+            return resume_text, "Please provide both resume and job description."
+        
+        return resume_text, None
+    
+    def _finish_edit(self, edited_resume: str, analysis_future) -> Tuple[str, str, Optional[str]]:
+        """Build the final (resume, analysis, PDF) result once the edit is done"""
+        pdf_path = self._create_pdf_for_edit(edited_resume)
+        return edited_resume, analysis_future.result(), pdf_path
+    
+    def _create_pdf_for_edit(self, edited_resume: str) -> Optional[str]:
+        """Create PDF if the edit succeeded"""
+        if edited_resume and not edited_resume.startswith("Error"):
+            return self.create_pdf_from_text(edited_resume)
+        return None
     
     def _mock_edit_resume(self, resume_text: str, job_description: str) -> str:
         """
@@ -201,7 +673,7 @@ class ResumeEditor:
 
 --- SUGGESTED ADDITIONS ---
 Based on the job description, consider highlighting these skills/keywords:
-{', '.join(job_keywords[:10])}
+{', '.join(list(job_keywords)[:10])}
 
 Note: This is a demo version. For full LLM integration, add your OpenAI API key.
 """
@@ -211,77 +683,151 @@ Note: This is a demo version. For full LLM integration, add your OpenAI API key.
         """
         Use Ollama DeepSeek R1 to extract and tailor resume information
         """
-        prompt = f"""
-        You must extract resume information and format it exactly as specified. Do not include any thinking, explanations, or commentary. Start your response immediately with "NAME:" and follow the exact format.
+        try:
+            response = "".join(self._ollama_edit_resume_stream(resume_text, job_description))
+            return self._clean_llm_output(response)
+        except Exception as e:
+            return self._ollama_error(e)
+    
+    def _ollama_edit_resume_stream(self, resume_text: str, job_description: str) -> Iterator[str]:
+        """
+        Stream the DeepSeek R1 response chunk by chunk; cached responses are yielded whole
+        """
+        resume_text, job_description, cache_key, resume_key = self._prepare_edit(resume_text, job_description)
+        cached_response, embedding = self._lookup_cached_edit(job_description, cache_key, resume_key)
+        if cached_response is not None:
+            yield cached_response
+            return
         
-        FORMAT REQUIRED:
-        NAME: [Full Name]
-        EMAIL: [Email Address]
-        PHONE: [Phone Number]
-        LOCATION: [City, State/Country]
+        stream = ollama.chat(stream=True, **self._chat_request(resume_text, job_description))
         
-        SUMMARY: [2-3 line professional summary tailored to the job]
+        recorder = _ChatRecorder()
+        for chunk in stream:
+            yield recorder.record(chunk)
         
-        EXPERIENCE:
-        - [Job Title] | [Company] | [Dates] | [Location]
-          [Bullet point achievement 1 with metrics if possible]
-          [Bullet point achievement 2 with metrics if possible]
-          [Bullet point achievement 3 with metrics if possible]
+        self._store_edit(cache_key, resume_key, recorder.text(), embedding, recorder.done_reason)
+    
+    async def _ollama_edit_resume_astream(self, resume_text: str, job_description: str) -> AsyncIterator[str]:
+        """
+        Async version of _ollama_edit_resume_stream using the shared AsyncClient
+        """
+        resume_text, job_description, cache_key, resume_key = self._prepare_edit(resume_text, job_description)
+        cached_response, embedding = await asyncio.to_thread(
+            self._lookup_cached_edit, job_description, cache_key, resume_key
+        )
+        if cached_response is not None:
+            yield cached_response
+            return
         
-        EDUCATION:
-        - [Degree] | [Institution] | [Year] | [Location]
+        stream = await self._async_client.chat(stream=True, **self._chat_request(resume_text, job_description))
         
-        SKILLS:
-        - [Skill Category]: [Relevant skills matching job requirements]
+        recorder = _ChatRecorder()
+        async for chunk in stream:
+            yield recorder.record(chunk)
         
-        PROJECTS: (if applicable)
-        - [Project Name]: [Brief description with technologies used]
+        await asyncio.to_thread(
+            self._store_edit, cache_key, resume_key, recorder.text(), embedding, recorder.done_reason
+        )
+    
+    def _prepare_edit(self, resume_text: str, job_description: str) -> Tuple[str, str, str, str]:
+        """Clamp the inputs and compute their exact-match cache key and the
+        resume-only key that scopes the semantic lookup"""
+        # Bound the prompt size so prefill cost stays predictable
+        resume_text = resume_text[:MAX_RESUME_CHARS]
+        job_description = job_description[:MAX_JOB_DESCRIPTION_CHARS]
         
-        Job Requirements:
-        {job_description}
+        cache_key = ResponseCache.make_key(self.model_name, _SYSTEM_PROMPT, resume_text, job_description)
+        resume_key = ResponseCache.make_key(self.model_name, _SYSTEM_PROMPT, resume_text)
+        return resume_text, job_description, cache_key, resume_key
+    
+    def _lookup_cached_edit(self, job_description: str, cache_key: str,
+                            resume_key: str) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """Return a cached response (if any) and the embedding used for the semantic lookup"""
+        # Cache failures only cost a cache miss, never the edit itself
+        try:
+            # Return a previous response for identical inputs
+            cached_response = self._cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response, None
+        except sqlite3.Error as e:
+            print(f"Warning: Response cache lookup failed: {e}")
+            return None, None
         
-        Original Resume:
-        {resume_text}
+        # Fall back to a response for the same resume and a near-identical job description
+        embedding = self._embed(job_description)
+        if embedding is not None:
+            try:
+                cached_response = self._cache.get_similar(resume_key, embedding)
+            except sqlite3.Error as e:
+                print(f"Warning: Response cache lookup failed: {e}")
+        return cached_response, embedding
+    
+    def _chat_request(self, resume_text: str, job_description: str) -> dict:
+        """Build the ollama.chat arguments for a resume edit"""
+        messages = [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": f"Job Requirements:\n{job_description}\n\nOriginal Resume:\n{resume_text}\n\nStart with NAME: immediately:"}
+        ]
         
-        Start with NAME: immediately:
-        """
+        return {
+            "model": self.model_name,
+            "messages": messages,
+            "options": {
+                "temperature": 0.3,  # Lower temperature for more consistent output
+                "top_p": 0.8,
+                "num_predict": LLM_NUM_PREDICT,  # Ollama's name for the output token limit
+                "num_ctx": LLM_NUM_CTX,
+                "num_keep": -1,  # Keep the whole prompt when the context shifts
+                "num_gpu": 999  # Offload every layer to the GPU when one is available
+            }
+        }
+    
+    def _store_edit(self, cache_key: str, resume_key: str, response: str,
+                    embedding: Optional[np.ndarray], done_reason: Optional[str] = None):
+        """Cache the cleaned response once generation has completed"""
+        # A run cut off at num_predict may still be inside <think>, and one
+        # without NAME: never reached the resume, so neither is worth replaying
+        if done_reason == "length":
+            return
+        cleaned_response = self._clean_llm_output(response)
+        if not cleaned_response or not _RE_NAME.search(cleaned_response):
+            return
         
+        # The generation already succeeded, so a cache write failure is only logged
         try:
-            response = ollama.chat(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                options={
-                    "temperature": 0.3,  # Lower temperature for more consistent output
-                    "top_p": 0.8,
-                    "max_tokens": 1500
-                }
-            )
-            
-            # Clean the response to remove thinking tags and unwanted content
-            cleaned_response = self._clean_llm_output(response['message']['content'])
-            
-            return cleaned_response
-            
-        except Exception as e:
-            return f"Error connecting to Ollama: {str(e)}\n\nPlease ensure Ollama is running and DeepSeek R1 model is installed.\nRun: ollama pull {self.model_name}"
+            self._cache.set(cache_key, cleaned_response, resume_key, embedding)
+        except sqlite3.Error as e:
+            print(f"Warning: Could not store response in cache: {e}")
+    
+    def _ollama_error(self, error: Exception) -> str:
+        """Format an Ollama failure as a user-facing message"""
+        return f"Error connecting to Ollama: {str(error)}\n\nPlease ensure Ollama is running and DeepSeek R1 model is installed.\nRun: ollama pull {self.model_name}"
     
     def _clean_llm_output(self, text: str) -> str:
         """Clean LLM output to remove thinking tags and unwanted content"""
-        import re
-        
-        # Remove <think> tags and their content
-        text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
+        # Remove <think> tags and their content. DeepSeek R1 emits a single
+        # leading block, so cut it out directly and use the regex only for
+        # extras in the remainder; running it over the spliced text could
+        # match a tag formed across the cut
+        start = text.find('<think>')
+        if start != -1:
+            end = text.find('</think>', start)
+            if end != -1:
+                tail = text[end + len('</think>'):]
+                if '<think>' in tail:
+                    tail = _RE_THINK.sub('', tail)
+                text = text[:start] + tail
         
         # Remove any remaining XML-like tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _RE_XML.sub('', text)
         
         # Find the start of the actual resume content (NAME:)
-        name_match = re.search(r'NAME:', text, re.IGNORECASE)
+        name_match = _RE_NAME.search(text)
         if name_match:
             text = text[name_match.start():]
         
         # Clean up extra whitespace and newlines
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)  # Remove excessive newlines
+        text = _RE_MULTINL.sub('\n\n', text)  # Remove excessive newlines
         text = text.strip()
         
         return text
@@ -320,25 +866,11 @@ Note: This is a demo version. For full LLM integration, add your OpenAI API key.
         
         return "OpenAI integration not configured. Using Ollama instead."
     
-    def _extract_keywords(self, job_description: str) -> list:
+    def _extract_keywords(self, job_description: str) -> frozenset:
         """
         Extract key skills and requirements from job description
         """
-        # Simple keyword extraction (in production, use more sophisticated NLP)
-        common_skills = [
-            'python', 'javascript', 'react', 'node.js', 'sql', 'aws', 'docker',
-            'kubernetes', 'machine learning', 'data analysis', 'project management',
-            'agile', 'scrum', 'communication', 'leadership', 'teamwork'
-        ]
-        
-        job_lower = job_description.lower()
-        found_keywords = [skill for skill in common_skills if skill in job_lower]
-        
-        # Also extract capitalized words (likely to be technologies/skills)
-        capitalized_words = re.findall(r'\b[A-Z][a-z]+\b', job_description)
-        found_keywords.extend(capitalized_words[:5])
-        
-        return list(set(found_keywords))
+        return _find_keywords(job_description)
     
     def _generate_analysis(self, resume_text: str, job_description: str) -> str:
         """
@@ -347,8 +879,8 @@ Note: This is a demo version. For full LLM integration, add your OpenAI API key.
         resume_keywords = self._extract_keywords(resume_text)
         job_keywords = self._extract_keywords(job_description)
         
-        matching_skills = set(resume_keywords) & set(job_keywords)
-        missing_skills = set(job_keywords) - set(resume_keywords)
+        matching_skills = resume_keywords & job_keywords
+        missing_skills = job_keywords - resume_keywords
         
         analysis = f"""
         📊 RESUME ANALYSIS
@@ -368,213 +900,308 @@ Note: This is a demo version. For full LLM integration, add your OpenAI API key.
         
         return analysis
 
-def create_interface():
-    """
-    Create the Gradio interface
-    """
-    editor = ResumeEditor()
+# Cache-Control for frontend assets. Files under /assets are content-hashed
+# and never change; /static files and the theme stylesheet are not hashed,
+# so they only get a day.
+_IMMUTABLE_CACHE_CONTROL = (b"public, max-age=31536000, immutable", ("/assets/",))
+_STATIC_CACHE_CONTROL = (b"public, max-age=86400", ("/static/", "/theme.css"))
+
+class StaticAssetMiddleware:
+    """ASGI middleware that gzips every HTTP response and sets long-lived
+    Cache-Control on static assets. GZipMiddleware already skips
+    text/event-stream, so queue streams are never buffered."""
     
-    # Enhanced CSS for professional styling
-    css = """
-    /* Global Styles */
-    .gradio-container {
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif !important;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        min-height: 100vh;
-    }
+    def __init__(self, app):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=1024)
     
-    /* Main container */
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
+        cache_control = None
+        for value, prefixes in (_IMMUTABLE_CACHE_CONTROL, _STATIC_CACHE_CONTROL):
+            if path.startswith(prefixes):
+                cache_control = value
+                break
+        
+        if cache_control is None:
+            await self.gzip_app(scope, receive, send)
+            return
+        
+        async def send_with_cache_control(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = [(k, v) for k, v in message.get("headers", []) if k.lower() != b"cache-control"]
+                headers.append((b"cache-control", cache_control))
+                message = {**message, "headers": headers}
+            await send(message)
+        
+        await self.gzip_app(scope, receive, send_with_cache_control)
+
+def _minify_html(html: str) -> str:
+    """Drop comments and collapse whitespace, including all whitespace between tags"""
+    html = _RE_HTML_COMMENT.sub('', html)
+    html = _RE_WHITESPACE.sub(' ', html)
+    return _RE_BETWEEN_TAGS.sub('><', html).strip()
+
+def _minify_css(css: str) -> str:
+    """Drop comments and the whitespace around CSS punctuation"""
+    css = _RE_CSS_COMMENT.sub('', css)
+    css = _RE_WHITESPACE.sub(' ', css)
+    return _RE_CSS_PUNCTUATION.sub(r'\1', css).strip()
+
+# Static page styles and setup/features footer, minified once at import time
+_CSS = _minify_css("""
+/* Global Styles */
+.gradio-container {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif !important;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+}
+
+/* Main container */
+.container {
+    max-width: 1400px;
+    margin: auto;
+    background: white;
+    border-radius: 20px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+
+/* Header styling */
+.main-header {
+    background: linear-gradient(135deg, #2c3e50 0%, #3498db 100%);
+    color: white;
+    padding: 30px;
+    text-align: center;
+    margin-bottom: 0;
+}
+
+.main-header h1 {
+    margin: 0;
+    font-size: 2.5rem;
+    font-weight: 700;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.main-header p {
+    margin: 10px 0 0 0;
+    font-size: 1.1rem;
+    opacity: 0.9;
+}
+
+/* Input sections */
+.input-section {
+    background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+    padding: 25px;
+    border-radius: 15px;
+    margin: 20px;
+    border: 1px solid #dee2e6;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.08);
+}
+
+/* Output sections */
+.output-section {
+    background: linear-gradient(135deg, #e8f5e9 0%, #d4edda 100%);
+    padding: 25px;
+    border-radius: 15px;
+    margin: 20px;
+    border: 1px solid #c3e6cb;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.08);
+}
+
+/* Tabs styling */
+.tab-nav {
+    background: #f8f9fa;
+    border-radius: 10px 10px 0 0;
+    padding: 5px;
+}
+
+.tab-nav button {
+    background: transparent;
+    border: none;
+    padding: 12px 20px;
+    border-radius: 8px;
+    font-weight: 600;
+    transition: all 0.3s ease;
+}
+
+.tab-nav button.selected {
+    background: #007bff;
+    color: white;
+    box-shadow: 0 2px 8px rgba(0,123,255,0.3);
+}
+
+/* Button styling */
+.btn-primary {
+    background: linear-gradient(135deg, #007bff 0%, #0056b3 100%) !important;
+    border: none !important;
+    padding: 15px 30px !important;
+    border-radius: 10px !important;
+    font-weight: 600 !important;
+    font-size: 1.1rem !important;
+    box-shadow: 0 5px 15px rgba(0,123,255,0.3) !important;
+    transition: all 0.3s ease !important;
+}
+
+.btn-primary:hover {
+    transform: translateY(-2px) !important;
+    box-shadow: 0 8px 25px rgba(0,123,255,0.4) !important;
+}
+
+/* Text areas and inputs */
+.gr-textbox textarea, .gr-textbox input {
+    border-radius: 10px !important;
+    border: 2px solid #e9ecef !important;
+    padding: 15px !important;
+    font-size: 14px !important;
+    transition: all 0.3s ease !important;
+}
+
+.gr-textbox textarea:focus, .gr-textbox input:focus {
+    border-color: #007bff !important;
+    box-shadow: 0 0 0 3px rgba(0,123,255,0.1) !important;
+}
+
+/* File upload styling */
+.gr-file {
+    border: 2px dashed #007bff !important;
+    border-radius: 15px !important;
+    padding: 30px !important;
+    text-align: center !important;
+    background: rgba(0,123,255,0.05) !important;
+    transition: all 0.3s ease !important;
+}
+
+.gr-file:hover {
+    background: rgba(0,123,255,0.1) !important;
+    border-color: #0056b3 !important;
+}
+
+/* Section headers */
+.section-header {
+    color: #2c3e50;
+    font-size: 1.3rem;
+    font-weight: 700;
+    margin-bottom: 15px;
+    padding-bottom: 10px;
+    border-bottom: 3px solid #007bff;
+    display: flex;
+    align-items: center;
+    gap: 10px;
+}
+
+/* Status indicators */
+.status-indicator {
+    display: inline-block;
+    padding: 5px 12px;
+    border-radius: 20px;
+    font-size: 0.9rem;
+    font-weight: 600;
+    margin-left: 10px;
+}
+
+.status-success {
+    background: #d4edda;
+    color: #155724;
+    border: 1px solid #c3e6cb;
+}
+
+.status-warning {
+    background: #fff3cd;
+    color: #856404;
+    border: 1px solid #ffeaa7;
+}
+
+/* Examples section */
+.examples-section {
+    background: linear-gradient(135deg, #fff3e0 0%, #ffe0b2 100%);
+    padding: 20px;
+    border-radius: 15px;
+    margin: 20px;
+    border: 1px solid #ffcc02;
+}
+
+/* Footer */
+.footer-section {
+    background: #f8f9fa;
+    padding: 30px;
+    text-align: center;
+    color: #6c757d;
+    border-top: 1px solid #dee2e6;
+}
+
+/* Responsive design */
+@media (max-width: 768px) {
     .container {
-        max-width: 1400px;
-        margin: auto;
-        background: white;
-        border-radius: 20px;
-        box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-        overflow: hidden;
+        margin: 10px;
+        border-radius: 10px;
     }
-    
-    /* Header styling */
-    .main-header {
-        background: linear-gradient(135deg, #2c3e50 0%, #3498db 100%);
-        color: white;
-        padding: 30px;
-        text-align: center;
-        margin-bottom: 0;
-    }
-    
+
     .main-header h1 {
-        margin: 0;
-        font-size: 2.5rem;
-        font-weight: 700;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .main-header p {
-        margin: 10px 0 0 0;
-        font-size: 1.1rem;
-        opacity: 0.9;
-    }
-    
-    /* Input sections */
-    .input-section {
-        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        padding: 25px;
-        border-radius: 15px;
-        margin: 20px;
-        border: 1px solid #dee2e6;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-    }
-    
-    /* Output sections */
-    .output-section {
-        background: linear-gradient(135deg, #e8f5e9 0%, #d4edda 100%);
-        padding: 25px;
-        border-radius: 15px;
-        margin: 20px;
-        border: 1px solid #c3e6cb;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-    }
-    
-    /* Tabs styling */
-    .tab-nav {
-        background: #f8f9fa;
-        border-radius: 10px 10px 0 0;
-        padding: 5px;
-    }
-    
-    .tab-nav button {
-        background: transparent;
-        border: none;
-        padding: 12px 20px;
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .tab-nav button.selected {
-        background: #007bff;
-        color: white;
-        box-shadow: 0 2px 8px rgba(0,123,255,0.3);
-    }
-    
-    /* Button styling */
-    .btn-primary {
-        background: linear-gradient(135deg, #007bff 0%, #0056b3 100%) !important;
-        border: none !important;
-        padding: 15px 30px !important;
-        border-radius: 10px !important;
-        font-weight: 600 !important;
-        font-size: 1.1rem !important;
-        box-shadow: 0 5px 15px rgba(0,123,255,0.3) !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .btn-primary:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(0,123,255,0.4) !important;
+        font-size: 2rem;
     }
-    
-    /* Text areas and inputs */
-    .gr-textbox textarea, .gr-textbox input {
-        border-radius: 10px !important;
-        border: 2px solid #e9ecef !important;
-        padding: 15px !important;
-        font-size: 14px !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .gr-textbox textarea:focus, .gr-textbox input:focus {
-        border-color: #007bff !important;
-        box-shadow: 0 0 0 3px rgba(0,123,255,0.1) !important;
-    }
-    
-    /* File upload styling */
-    .gr-file {
-        border: 2px dashed #007bff !important;
-        border-radius: 15px !important;
-        padding: 30px !important;
-        text-align: center !important;
-        background: rgba(0,123,255,0.05) !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .gr-file:hover {
-        background: rgba(0,123,255,0.1) !important;
-        border-color: #0056b3 !important;
-    }
-    
-    /* Section headers */
-    .section-header {
-        color: #2c3e50;
-        font-size: 1.3rem;
-        font-weight: 700;
-        margin-bottom: 15px;
-        padding-bottom: 10px;
-        border-bottom: 3px solid #007bff;
-        display: flex;
-        align-items: center;
-        gap: 10px;
-    }
-    
-    /* Status indicators */
-    .status-indicator {
-        display: inline-block;
-        padding: 5px 12px;
-        border-radius: 20px;
-        font-size: 0.9rem;
-        font-weight: 600;
-        margin-left: 10px;
-    }
-    
-    .status-success {
-        background: #d4edda;
-        color: #155724;
-        border: 1px solid #c3e6cb;
-    }
-    
-    .status-warning {
-        background: #fff3cd;
-        color: #856404;
-        border: 1px solid #ffeaa7;
-    }
-    
-    /* Examples section */
-    .examples-section {
-        background: linear-gradient(135deg, #fff3e0 0%, #ffe0b2 100%);
-        padding: 20px;
-        border-radius: 15px;
-        margin: 20px;
-        border: 1px solid #ffcc02;
-    }
-    
-    /* Footer */
-    .footer-section {
-        background: #f8f9fa;
-        padding: 30px;
-        text-align: center;
-        color: #6c757d;
-        border-top: 1px solid #dee2e6;
-    }
-    
-    /* Responsive design */
-    @media (max-width: 768px) {
-        .container {
-            margin: 10px;
-            border-radius: 10px;
-        }
-        
-        .main-header h1 {
-            font-size: 2rem;
-        }
-        
-        .input-section, .output-section {
-            margin: 10px;
-            padding: 15px;
-        }
+
+    .input-section, .output-section {
+        margin: 10px;
+        padding: 15px;
     }
+}
+""")
+
+_FOOTER_HTML = _minify_html("""
+<div class="footer-section">
+    <div style="max-width: 800px; margin: auto;">
+        <h3 style="color: #2c3e50; margin-bottom: 20px;">🚀 Setup Instructions</h3>
+
+        <div style="text-align: left; margin-bottom: 30px;">
+            <p><strong>1.</strong> Ensure Ollama is running: <code>ollama serve</code></p>
+            <p><strong>2.</strong> Install DeepSeek R1 model: <code>ollama pull deepseek-r1:7b-qwen-distill-q4_K_M</code></p>
+            <p><strong>3.</strong> Install required packages: <code>pip install ollama pypdfium2 reportlab numpy gradio "uvicorn[standard]"</code></p>
+        </div>
+
+        <h3 style="color: #2c3e50; margin-bottom: 20px;">📋 Features</h3>
+        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-bottom: 30px;">
+            <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; border-left: 4px solid #007bff;">
+                <strong>🔍 Resume Analysis</strong><br>
+                <small>Identifies matching and missing skills</small>
+            </div>
+            <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; border-left: 4px solid #28a745;">
+                <strong>🎯 Keyword Optimization</strong><br>
+                <small>Suggests relevant keywords from job description</small>
+            </div>
+            <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; border-left: 4px solid #ffc107;">
+                <strong>📄 Professional Formatting</strong><br>
+                <small>Maintains resume structure and LaTeX output</small>
+            </div>
+            <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; border-left: 4px solid #dc3545;">
+                <strong>💡 AI Recommendations</strong><br>
+                <small>Provides actionable improvement suggestions</small>
+            </div>
+        </div>
+
+        <hr style="border: none; height: 1px; background: #dee2e6; margin: 30px 0;">
+
+        <div style="text-align: center; color: #6c757d;">
+            <p style="margin: 10px 0;">✨ <strong>Developed by Khadija Nadeem</strong> ✨</p>
+            <p style="margin: 5px 0;">📧 <a href="mailto:khadija.nadeem714@gmail.com" style="color: #007bff; text-decoration: none;">khadija.nadeem714@gmail.com</a></p>
+            <p style="margin: 15px 0 5px 0; font-size: 0.9rem;">Powered by <strong>DeepSeek R1</strong> • Built with <strong>Gradio</strong> & <strong>Python</strong></p>
+            <p style="margin: 5px 0; font-size: 0.8rem; opacity: 0.8;">© 2024 AI Resume Editor - Transform your career with AI</p>
+        </div>
+    </div>
+</div>
+""")
+
+def create_interface():
     """
+    Create the Gradio interface
+    """
+    editor = ResumeEditor()
     
-    with gr.Blocks(css=css, title="🎯 AI Resume Editor - Powered by DeepSeek R1", theme=gr.themes.Soft()) as interface:
+    with gr.Blocks(title="🎯 AI Resume Editor - Powered by DeepSeek R1") as interface:
         # Header Section
         with gr.Row(elem_classes="main-header"):
             gr.HTML("""
@@ -751,80 +1378,85 @@ Responsibilities:
                 return f"Error reading PDF: {str(e)}"
         
         # Wrapper function for the edit button
-        def edit_resume_wrapper(resume_text, job_desc, pdf_file):
-            result = editor.edit_resume(resume_text, job_desc, pdf_file)
-            if len(result) == 3:
-                edited_text, analysis, pdf_path = result
-                return edited_text, analysis, pdf_path
-            else:
-                # Fallback for compatibility
-                return result[0], result[1], None
+        async def edit_resume_wrapper(resume_text, job_desc, pdf_file):
+            # Stream partial output to the textbox while the model generates
+            async for result in editor.edit_resume_astream(resume_text, job_desc, pdf_file):
+                yield result
         
         # Connect PDF upload to preview
         pdf_input.change(
             fn=preview_pdf,
             inputs=[pdf_input],
-            outputs=[pdf_text_preview]
+            outputs=[pdf_text_preview],
+            concurrency_id="cpu",
+            concurrency_limit=PREVIEW_CONCURRENCY
         )
         
         # Connect the edit button to the function
         edit_btn.click(
             fn=edit_resume_wrapper,
             inputs=[resume_input, job_input, pdf_input],
-            outputs=[edited_output, analysis_output, pdf_download]
+            outputs=[edited_output, analysis_output, pdf_download],
+            concurrency_id="llm",
+            concurrency_limit=LLM_CONCURRENCY
         )
         
         # Footer Section
-        gr.HTML("""
-        <div class="footer-section">
-            <div style="max-width: 800px; margin: auto;">
-                <h3 style="color: #2c3e50; margin-bottom: 20px;">🚀 Setup Instructions</h3>
-                
-                <div style="text-align: left; margin-bottom: 30px;">
-                    <p><strong>1.</strong> Ensure Ollama is running: <code>ollama serve</code></p>
-                    <p><strong>2.</strong> Install DeepSeek R1 model: <code>ollama pull deepseek-r1:latest</code></p>
-                    <p><strong>3.</strong> Install required packages: <code>pip install ollama PyPDF2 reportlab gradio</code></p>
-                </div>
-                
-                <h3 style="color: #2c3e50; margin-bottom: 20px;">📋 Features</h3>
-                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-bottom: 30px;">
-                    <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; border-left: 4px solid #007bff;">
-                        <strong>🔍 Resume Analysis</strong><br>
-                        <small>Identifies matching and missing skills</small>
-                    </div>
-                    <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; border-left: 4px solid #28a745;">
-                        <strong>🎯 Keyword Optimization</strong><br>
-                        <small>Suggests relevant keywords from job description</small>
-                    </div>
-                    <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; border-left: 4px solid #ffc107;">
-                        <strong>📄 Professional Formatting</strong><br>
-                        <small>Maintains resume structure and LaTeX output</small>
-                    </div>
-                    <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; border-left: 4px solid #dc3545;">
-                        <strong>💡 AI Recommendations</strong><br>
-                        <small>Provides actionable improvement suggestions</small>
-                    </div>
-                </div>
-                
-                <hr style="border: none; height: 1px; background: #dee2e6; margin: 30px 0;">
-                
-                <div style="text-align: center; color: #6c757d;">
-                    <p style="margin: 10px 0;">✨ <strong>Developed by Khadija Nadeem</strong> ✨</p>
-                    <p style="margin: 5px 0;">📧 <a href="mailto:khadija.nadeem714@gmail.com" style="color: #007bff; text-decoration: none;">khadija.nadeem714@gmail.com</a></p>
-                    <p style="margin: 15px 0 5px 0; font-size: 0.9rem;">Powered by <strong>DeepSeek R1</strong> • Built with <strong>Gradio</strong> & <strong>Python</strong></p>
-                    <p style="margin: 5px 0; font-size: 0.8rem; opacity: 0.8;">© 2024 AI Resume Editor - Transform your career with AI</p>
-                </div>
-            </div>
-        </div>
-        """)
+        gr.HTML(_FOOTER_HTML)
     
     return interface
 
-if __name__ == "__main__":
+def create_queued_interface():
+    """
+    Create the Gradio interface with its request queue configured
+    """
     interface = create_interface()
-    interface.launch(
-        server_name="127.0.0.1",
-        server_port=None,  # Let Gradio find an available port
-        share=True,
-        debug=True
+    # The edit and preview events set their own pools (LLM_CONCURRENCY and
+    # PREVIEW_CONCURRENCY); GRADIO_CONCURRENCY only bounds events without one,
+    # such as the examples loader. api_open=False keeps the REST API from
+    # bypassing the queue.
+    interface.queue(
+        default_concurrency_limit=int(os.getenv("GRADIO_CONCURRENCY", "4")),
+        max_size=64,
+        api_open=False
     )
+    return interface
+
+def create_app() -> FastAPI:
+    """
+    ASGI app factory for uvicorn: the queued interface mounted on FastAPI.
+    Each worker process calls this itself, so every worker builds its own
+    editor and Ollama clients.
+    """
+    app = FastAPI(middleware=[Middleware(StaticAssetMiddleware)])
+    # Gradio 6 applies the page CSS and theme where the app is served, not in Blocks()
+    return gr.mount_gradio_app(app, create_queued_interface(), path="/",
+                               css=_CSS, theme=gr.themes.Soft())
+
+if __name__ == "__main__":
+    server_name = "127.0.0.1"
+    server_port = int(os.getenv("GRADIO_SERVER_PORT", "7860"))  # Fixed port, no startup scan
+    
+    if os.getenv("GRADIO_SHARE") == "1":
+        # The public share tunnel is only available through launch()
+        create_queued_interface().launch(
+            server_name=server_name,
+            server_port=server_port,
+            share=True,
+            debug=False,
+            css=_CSS,
+            theme=gr.themes.Soft(),
+            app_kwargs={"middleware": [Middleware(StaticAssetMiddleware)]}
+        )
+    else:
+        # Gradio keeps queue state per process, so more than one worker needs a
+        # load balancer with sticky sessions in front; set UVICORN_WORKERS to scale
+        uvicorn.run(
+            "resume_editor:create_app",
+            factory=True,
+            host=server_name,
+            port=server_port,
+            # uvicorn's default loop/http="auto" picks uvloop and httptools
+            # when installed (uvicorn[standard]) and asyncio/h11 otherwise
+            workers=int(os.getenv("UVICORN_WORKERS", "1"))
+        )